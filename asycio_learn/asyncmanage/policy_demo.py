@@ -0,0 +1,62 @@
+# 模拟一个不稳定的后端（偶尔很慢、偶尔报错），对比有无 TaskPolicy 的尾延迟
+# python -m asycio_learn.asyncmanage.policy_demo
+import asyncio
+import random
+import time
+
+from asycio_learn.asyncmanage.run_async import AsyncBackgroundExecutor, TaskPolicy
+
+
+async def flaky_backend(i: int) -> int:
+    # 大部分 20ms 左右，3% 卡 500ms；5% 直接报错
+    await asyncio.sleep(0.5 if random.random() < 0.03 else random.uniform(0.015, 0.025))
+    if random.random() < 0.05:
+        raise ConnectionError("backend reset")
+    return i
+
+
+async def timed_call(executor, i, policy):
+    start = time.perf_counter()
+    try:
+        await executor.submit(flaky_backend, i, __policy__=policy)
+        ok = True
+    except (ConnectionError, asyncio.TimeoutError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+async def paced(executor, policy, calls, interval=0.002):
+    # 按固定速率发请求，而不是一次性全部发出去
+    tasks = []
+    for i in range(calls):
+        tasks.append(asyncio.create_task(timed_call(executor, i, policy)))
+        await asyncio.sleep(interval)
+    return await asyncio.gather(*tasks)
+
+
+async def run(label, policy, calls=500):
+    executor = AsyncBackgroundExecutor()
+    try:
+        async with executor:
+            # 先预热一批，让 hedge 有 p95 可用
+            if policy is not None and policy.hedge:
+                await paced(executor, policy, 100)
+            results = await paced(executor, policy, calls)
+    except (ConnectionError, asyncio.TimeoutError):
+        # 退出时 executor 会重新抛出失败任务的异常，这里已经统计过了
+        pass
+    latencies = sorted(t for t, _ in results)
+    failed = sum(not ok for _, ok in results)
+    p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+    print(f"{label:<24} p50 {p50 * 1000:6.1f}ms  p99 {p99 * 1000:6.1f}ms  failed {failed:3d}  {executor.stats}")
+
+
+async def main():
+    await run("no policy", None)
+    await run("retry", TaskPolicy(retries=3, backoff=0.01))
+    await run("retry + hedge", TaskPolicy(retries=3, backoff=0.01, hedge=True))
+    await run("retry + hedge + deadline", TaskPolicy(retries=3, backoff=0.01, hedge=True, deadline=0.3))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
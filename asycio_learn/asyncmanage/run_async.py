@@ -1,26 +1,109 @@
 import asyncio
 import concurrent.futures
+import functools
+import heapq
+import inspect
+import itertools
+import random
 import sys
+from collections import deque
 from contextlib import ExitStack
 from contextvars import copy_context
+from dataclasses import dataclass
 from types import TracebackType
 from typing import (
     AsyncContextManager,
     Awaitable,
     Callable,
     ContextManager,
+    Hashable,
     Optional,
     Protocol,
+    Tuple,
+    Type,
     TypeVar,
 )
 
-from typing_extensions import ParamSpec
-
-from langgraph.errors import GraphInterrupt
+try:
+    from typing import ParamSpec
+except ImportError:  # Python < 3.10
+    from typing_extensions import ParamSpec
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# exception types that signal an interruption rather than an error
+_interrupt_exceptions: list[Type[BaseException]] = []
+
+
+def register_interrupt_exception(exc_type: Type[BaseException]) -> None:
+    """Treat exc_type raised by a task as an interruption, not re-raised on exit."""
+    if exc_type not in _interrupt_exceptions:
+        _interrupt_exceptions.append(exc_type)
+
+
+def interrupt_exceptions() -> Tuple[Type[BaseException], ...]:
+    # langgraph's GraphInterrupt is recognised without importing langgraph:
+    # if langgraph.errors was never imported, nothing can have raised it
+    errors = sys.modules.get("langgraph.errors")
+    graph_interrupt = getattr(errors, "GraphInterrupt", None)
+    if graph_interrupt is not None:
+        return (*_interrupt_exceptions, graph_interrupt)
+    return tuple(_interrupt_exceptions)
+
+
+@dataclass
+class TaskPolicy:
+    # overall time budget in seconds, covers all retries and hedges
+    deadline: Optional[float] = None
+    # extra attempts after the first one fails with one of retry_on
+    retries: int = 0
+    # full-jitter exponential backoff: sleep uniform(0, min(max_backoff, backoff * 2**n))
+    backoff: float = 0.1
+    max_backoff: float = 2.0
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    # start a duplicate attempt if the first is slower than the recent p95
+    # latency of this function, the slower attempt is cancelled
+    hedge: bool = False
+    # delay used until hedge_min_samples latencies have been recorded
+    hedge_delay: Optional[float] = None
+    hedge_min_samples: int = 20
+    # functions sharing this key share latency samples, defaults to latency_key(fn)
+    latency_key: Optional[Hashable] = None
+
+
+def latency_key(fn: Callable) -> Hashable:
+    """
+    Bucket for the latency samples of fn: the code object of the function it runs.
+
+    partials, functools.wraps decorators and bound methods are unwrapped, so
+    every call of one definition shares a bucket and the number of buckets is
+    bounded by the code, not by how many callables were created. Callable
+    objects without code share a bucket per class.
+    """
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    fn = inspect.unwrap(getattr(fn, "__func__", fn))
+    code = getattr(fn, "__code__", None)
+    return code if code is not None else type(fn)
+
+
+@dataclass
+class ExecutorStats:
+    retries: int = 0
+    hedges: int = 0
+    deadline_misses: int = 0
+    deduplicated: int = 0
+
+
+@dataclass
+class TaskRecord:
+    name: str
+    key: Optional[Hashable]
+    # "done", "failed", "cancelled" or "interrupted"
+    outcome: str
+    error: Optional[BaseException] = None
+
 
 class Submit(Protocol[P, T]):
     def __call__(
@@ -29,15 +112,34 @@ class Submit(Protocol[P, T]):
         *args: P.args,
         __name__: Optional[str] = None,
         __cancel_on_exit__: bool = False,
+        __policy__: Optional[TaskPolicy] = None,
+        __key__: Optional[Hashable] = None,
+        __priority__: int = 0,
         **kwargs: P.kwargs,
     ) -> concurrent.futures.Future[T]:
         ...
 
 class AsyncBackgroundExecutor(AsyncContextManager):
-    def __init__(self) -> None:
+    def __init__(self, max_concurrency: Optional[int] = None, retain: int = 1000) -> None:
         self.context_not_supported = sys.version_info < (3, 11)
+        # only unfinished tasks are kept here, finished ones move to `finished`
         self.tasks: dict[asyncio.Task, bool] = {}
         self.sentinel = object()
+        # single-flight: dedup key -> in-flight task
+        self.inflight: dict[Hashable, asyncio.Task] = {}
+        self.task_keys: dict[asyncio.Task, Hashable] = {}
+        # the last `retain` finished tasks, and the first failure to re-raise on exit
+        self.finished: deque[TaskRecord] = deque(maxlen=retain)
+        self.first_error: Optional[BaseException] = None
+        # priority admission: at most max_concurrency tasks run at once,
+        # waiting tasks are admitted lowest __priority__ first, FIFO within a priority
+        self.max_concurrency = max_concurrency
+        self.running = 0
+        self.waiting: list[tuple[int, int, asyncio.Future]] = []
+        self.sequence = itertools.count()
+        self.stats = ExecutorStats()
+        # recent successful attempt latencies per function, used for hedging
+        self.latencies: dict[Hashable, deque] = {}
 
     def submit(
         self,
@@ -45,28 +147,168 @@ class AsyncBackgroundExecutor(AsyncContextManager):
         *args: P.args,
         __name__: Optional[str] = None,
         __cancel_on_exit__: bool = False,
+        __policy__: Optional[TaskPolicy] = None,
+        __key__: Optional[Hashable] = None,
+        __priority__: int = 0,
         **kwargs: P.kwargs,
     ) -> asyncio.Task[T]:
-        coro = fn(*args, **kwargs)
+        # an identical call is already running: share its task and result
+        # (cancelling the shared task cancels it for every caller)
+        if __key__ is not None and __key__ in self.inflight:
+            self.stats.deduplicated += 1
+            return self.inflight[__key__]
+        if __policy__ is None:
+            call = lambda: fn(*args, **kwargs)
+        else:
+            # fn is called once per attempt, so retries and hedges get fresh coroutines
+            call = lambda: self.run_with_policy(fn, args, kwargs, __policy__)
+        if self.max_concurrency is None:
+            coro = call()
+        else:
+            coro = self.admitted(call, __priority__)
         if self.context_not_supported:
             task = asyncio.create_task(coro, name=__name__)
         else:
             task = asyncio.create_task(coro, name=__name__, context=copy_context())
         self.tasks[task] = __cancel_on_exit__
+        if __key__ is not None:
+            self.inflight[__key__] = task
+            self.task_keys[task] = __key__
         task.add_done_callback(self.done)
         return task
 
+    async def acquire(self, priority: int) -> None:
+        if self.running < self.max_concurrency and not self.waiting:
+            self.running += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiting, (priority, next(self.sequence), waiter))
+        try:
+            # release() hands its slot over by resolving the waiter
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self.waiting:
+            _, _, waiter = heapq.heappop(self.waiting)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.running -= 1
+
+    async def admitted(self, call: Callable[[], Awaitable[T]], priority: int) -> T:
+        await self.acquire(priority)
+        try:
+            return await call()
+        finally:
+            self.release()
+
+    def record_latency(self, key: Hashable, seconds: float) -> None:
+        samples = self.latencies.get(key)
+        if samples is None:
+            samples = self.latencies[key] = deque(maxlen=200)
+        samples.append(seconds)
+
+    def hedge_delay(self, key: Hashable, policy: TaskPolicy) -> Optional[float]:
+        samples = self.latencies.get(key)
+        if samples is None or len(samples) < policy.hedge_min_samples:
+            return policy.hedge_delay
+        ordered = sorted(samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    async def attempt(
+        self, fn: Callable[..., Awaitable[T]], args: tuple, kwargs: dict, policy: TaskPolicy, key: Hashable
+    ) -> T:
+        loop = asyncio.get_running_loop()
+
+        async def timed() -> T:
+            start = loop.time()
+            result = await fn(*args, **kwargs)
+            self.record_latency(key, loop.time() - start)
+            return result
+
+        attempts = [asyncio.ensure_future(timed())]
+        try:
+            delay = self.hedge_delay(key, policy) if policy.hedge else None
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done:
+                    self.stats.hedges += 1
+                    attempts.append(asyncio.ensure_future(timed()))
+            pending = set(attempts)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = None
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    failed = task
+                if not pending:
+                    return failed.result()
+        finally:
+            # cancel the loser (or everything, if we were cancelled ourselves)
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+                task.add_done_callback(self.discard_result)
+
+    @staticmethod
+    def discard_result(task: asyncio.Task) -> None:
+        # a losing attempt may still fail, mark its exception as retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def run_with_policy(
+        self, fn: Callable[..., Awaitable[T]], args: tuple, kwargs: dict, policy: TaskPolicy
+    ) -> T:
+        key = policy.latency_key if policy.latency_key is not None else latency_key(fn)
+
+        async def attempts() -> T:
+            retry = 0
+            while True:
+                try:
+                    return await self.attempt(fn, args, kwargs, policy, key)
+                except policy.retry_on:
+                    if retry >= policy.retries:
+                        raise
+                    retry += 1
+                    self.stats.retries += 1
+                    backoff = min(policy.max_backoff, policy.backoff * 2 ** (retry - 1))
+                    await asyncio.sleep(random.uniform(0, backoff))
+
+        if policy.deadline is None:
+            return await attempts()
+        try:
+            return await asyncio.wait_for(attempts(), policy.deadline)
+        except asyncio.TimeoutError:
+            self.stats.deadline_misses += 1
+            raise
+
     def done(self, task: asyncio.Task) -> None:
+        self.tasks.pop(task, None)
+        key = self.task_keys.pop(task, None)
+        if key is not None and self.inflight.get(key) is task:
+            del self.inflight[key]
+        error = None
         try:
             task.result()
-        except GraphInterrupt:
-            # This exception is an interruption signal, not an error
-            # so we don't want to re-raise it on exit
-            self.tasks.pop(task)
-        except BaseException:
-            pass
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+        except BaseException as exc:
+            if isinstance(exc, interrupt_exceptions()):
+                # This exception is an interruption signal, not an error
+                # so we don't want to re-raise it on exit
+                outcome = "interrupted"
+            else:
+                outcome, error = "failed", exc
+                if self.first_error is None:
+                    self.first_error = exc
         else:
-            self.tasks.pop(task)
+            outcome = "done"
+        self.finished.append(TaskRecord(task.get_name(), key, outcome, error))
 
     async def __aenter__(self) -> Submit:
         return self.submit
@@ -83,15 +325,11 @@ class AsyncBackgroundExecutor(AsyncContextManager):
                 task.cancel(self.sentinel)
         # wait for all tasks to finish
         if self.tasks:
-            await asyncio.wait(self.tasks)
+            await asyncio.wait(list(self.tasks))
         # re-raise the first exception that occurred in a task
-        if exc_type is None:
+        if exc_type is None and self.first_error is not None:
             # if there's already an exception being raised, don't raise another one
-            for task in self.tasks:
-                try:
-                    task.result()
-                except asyncio.CancelledError:
-                    pass
+            raise self.first_error
 
     async def __aexit__(
         self,
@@ -105,26 +343,23 @@ class AsyncBackgroundExecutor(AsyncContextManager):
         # wait for all background tasks to finish, shielded from cancellation
         await asyncio.shield(self.exit(exc_type, exc_value, traceback))
 
-import asyncio
-from typing import Awaitable, Callable
-
-
 async def do_some_work(name: str) -> None:
     print(f"Starting work: {name}")
     await asyncio.sleep(2)
     print(f"Finished work: {name}")
 
 async def main():
-    async with AsyncBackgroundExecutor() as executor:
+    async with AsyncBackgroundExecutor() as submit:
         # Submit a task that should be cancelled on exit
-        task1 = executor.submit(do_some_work, "Task 1", __cancel_on_exit__=True)
+        task1 = submit(do_some_work, "Task 1", __cancel_on_exit__=True)
 
         # Submit a task that should not be cancelled on exit
-        task2 = executor.submit(do_some_work, "Task 2", __cancel_on_exit__=False)
+        task2 = submit(do_some_work, "Task 2", __cancel_on_exit__=False)
 
         # Wait for the tasks to complete
         await asyncio.gather(task1, task2)
 
         print("All tasks completed!")
 
-asyncio.run(main())
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
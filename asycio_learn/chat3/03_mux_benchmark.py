@@ -0,0 +1,42 @@
+# 对比 每个请求一个连接 和 MuxClient 多路复用
+# 默认在本进程里起一个和 02_asynce_Web.py 一样的 echo 服务器
+# 已经在跑 02_asynce_Web.py 的话: python -m asycio_learn.chat3.03_mux_benchmark --port 8000
+import argparse
+import asyncio
+import time
+
+from asycio_learn.chat3.load_test import connect_per_request, load, start_echo_server
+from asycio_learn.chat3.mux_client import MuxClient
+
+
+async def run(label, call, requests, concurrency):
+    start = time.perf_counter()
+    results = await load(call, requests, concurrency)
+    total = time.perf_counter() - start
+    failed = sum(isinstance(r, BaseException) for r in results)
+    print(f"{label:<22} {requests} requests in {total:.3f}s ({requests / total:,.0f} req/s), {failed} failed")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, default=500)
+    parser.add_argument('--pool-size', type=int, default=4)
+    args = parser.parse_args()
+
+    host, server = '127.0.0.1', None
+    port = args.port
+    if port is None:
+        server, port = await start_echo_server(host)
+
+    await run('connect-per-request', lambda p: connect_per_request(host, port, p), args.requests, args.concurrency)
+    async with MuxClient(host, port, pool_size=args.pool_size) as client:
+        await run('MuxClient pipelined', client.request, args.requests, args.concurrency)
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+
+asyncio.run(main())
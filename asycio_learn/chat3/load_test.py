@@ -0,0 +1,43 @@
+# echo 服务器的压测工具，03_mux_benchmark.py 和 benchmarks/bench_servers.py 共用
+# echo() 和 02_asynce_Web.py 的行为一样：收到什么就原样发回去
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+
+
+async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while data := await reader.read(1024):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_echo_server(host: str = '127.0.0.1', port: int = 0) -> Tuple[asyncio.Server, int]:
+    """Start an in-process echo server, port 0 picks a free port."""
+    server = await asyncio.start_server(echo, host, port, backlog=1024)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def connect_per_request(host: str, port: int, payload: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(b'0 %s\r\n' % payload)
+        await writer.drain()
+        return await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def load(call: Callable[[bytes], Awaitable[bytes]], requests: int, concurrency: int) -> List:
+    """Send requests payloads through call with at most concurrency in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            return await call(b'hello %d' % i)
+
+    return await asyncio.gather(*(one(i) for i in range(requests)), return_exceptions=True)
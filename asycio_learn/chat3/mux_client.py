@@ -0,0 +1,130 @@
+# 多路复用客户端：少量长连接，每条连接上同时跑很多个请求
+# 帧格式: b"<request id> <payload>\r\n"，echo 服务器原样返回，按 id 找到对应的 Future
+# 和 chat2/07_future.py 一样是手动 set_result 的 Future，只是放在 dict 里按 id 管理
+import asyncio
+import itertools
+from asyncio import Future
+from typing import Dict, List, Optional
+
+
+class MuxConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.pending: Dict[int, Future] = {}
+        self.ids = itertools.count()
+        self.closed = False
+        self.read_task = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> 'MuxConnection':
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.pending)
+
+    async def _read_loop(self) -> None:
+        error: BaseException = ConnectionError('connection closed by server')
+        try:
+            while line := await self.reader.readline():
+                request_id, _, body = line.rstrip(b'\r\n').partition(b' ')
+                # 超时或取消的请求已经从 pending 里删掉了，晚到的响应直接丢弃
+                future = self.pending.pop(int(request_id), None)
+                if future is not None and not future.done():
+                    future.set_result(body)
+        except (ConnectionError, ValueError) as ex:
+            error = ex
+        finally:
+            self.closed = True
+            # the connection is unusable from here on, release the socket right away
+            self.writer.close()
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.pending.clear()
+
+    async def request(self, payload: bytes, timeout: Optional[float] = None) -> bytes:
+        if b'\n' in payload or b'\r' in payload:
+            raise ValueError('payload must not contain line breaks')
+        if self.closed:
+            raise ConnectionError('connection is closed')
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+
+        async def send_and_wait() -> bytes:
+            self.writer.write(b'%d %s\r\n' % (request_id, payload))
+            # drain blocks while the server is not reading, so it counts towards the timeout
+            await self.writer.drain()
+            return await future
+
+        try:
+            return await asyncio.wait_for(send_and_wait(), timeout)
+        finally:
+            # 超时、取消、出错都要清理，不然 pending 会越来越大
+            self.pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self.read_task
+
+
+class MuxClient:
+    """
+    Pool of persistent MuxConnections to the chat3 echo server.
+
+    Each request goes to the connection with the fewest requests in flight.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8000, pool_size: int = 4,
+                 timeout: Optional[float] = 5.0):
+        self.host = host
+        self.port = port
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.connections: List[MuxConnection] = []
+        # one lock per pool slot, so a dead connection is replaced exactly once
+        self.locks: List[asyncio.Lock] = []
+
+    async def connect(self) -> None:
+        self.connections = list(await asyncio.gather(
+            *(MuxConnection.open(self.host, self.port) for _ in range(self.pool_size))
+        ))
+        self.locks = [asyncio.Lock() for _ in self.connections]
+
+    async def _reconnect(self, index: int) -> None:
+        async with self.locks[index]:
+            # another caller may have replaced it while we waited for the lock
+            dead = self.connections[index]
+            if not dead.closed:
+                return
+            await dead.close()
+            self.connections[index] = await MuxConnection.open(self.host, self.port)
+
+    async def _pick(self) -> MuxConnection:
+        for i, conn in enumerate(self.connections):
+            if conn.closed:
+                await self._reconnect(i)
+        return min(self.connections, key=lambda conn: conn.in_flight)
+
+    async def request(self, payload: bytes, timeout: Optional[float] = None) -> bytes:
+        conn = await self._pick()
+        return await conn.request(payload, self.timeout if timeout is None else timeout)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(conn.close() for conn in self.connections))
+        self.connections = []
+        self.locks = []
+
+    async def __aenter__(self) -> 'MuxClient':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
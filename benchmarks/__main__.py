@@ -0,0 +1,48 @@
+# python -m benchmarks                        # 跑全部，和 baseline.json 比较，有回归返回 1
+# python -m benchmarks -k db --save out.json  # 只跑名字里带 db 的，结果另存
+# python -m benchmarks --update-baseline      # 确认是改进之后更新基线
+import argparse
+import os
+import sys
+
+from benchmarks import bench_cpu, bench_db, bench_servers  # noqa: F401  (register benchmarks)
+from benchmarks.baseline import compare, load_results, merge, report, save_results
+from benchmarks.runner import CALIBRATION, calibrate, calibrated, run, thresholds
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', dest='pattern', help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, help='override minimum repeat count of every benchmark')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds to spend on each benchmark at least')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save', help='write this run to a JSON file')
+    parser.add_argument('--update-baseline', action='store_true')
+    # 纯 CPU 的 benchmark 校准之后，共享机器上前后两次运行仍会差到 45%；I/O 的 benchmark 自带更宽的 threshold
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='allowed slowdown of benchmarks without their own threshold, 0.5 = 50%%')
+    parser.add_argument('--min-delta', type=float, default=0.001, help='ignore slowdowns below this many seconds')
+    args = parser.parse_args()
+
+    # calibration 每次都跑，和基线比较时用来抵消机器整体速度对纯 CPU benchmark 的影响
+    calibration = calibrate()
+    current = {CALIBRATION: calibration, **run(args.pattern, args.repeat, args.min_time, calibration)}
+    if args.save:
+        save_results(args.save, current)
+
+    baseline = load_results(args.baseline) if os.path.exists(args.baseline) else {}
+    if args.update_baseline:
+        # 只覆盖这次跑过的条目，用 -k 更新一部分时不会丢掉其他基线（旧的 calibrated 条目按 calibration 换算）
+        save_results(args.baseline, merge(current, baseline, calibrated()))
+        report(current, baseline, [], 's', calibrated())
+        return 0
+
+    regressions = compare(current, baseline, args.threshold, args.min_delta, calibrated(), thresholds())
+    report(current, baseline, regressions, 's', calibrated())
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# 保存 benchmark 结果到 JSON，并和仓库里的基线比较
+# 所有结果都是 "越小越好" 的数值（秒、微秒）
+# 结果里有 "calibration"（runner.calibrate() 的时间）时，calibrated 的条目（纯 CPU 的 benchmark）
+# 先按两次的 calibration 比值换算到基线那台机器/那个时刻的速度再比较；I/O 的条目按原始值比较
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from benchmarks.runner import CALIBRATION
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+def save_results(path: str, results: Dict[str, float]) -> None:
+    data = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_results(path: str) -> Dict[str, float]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def scale(current: Dict[str, float], baseline: Dict[str, float]) -> float:
+    """Factor that converts current calibrated results to the speed of the baseline run, 1.0 without calibration."""
+    if current.get(CALIBRATION) and baseline.get(CALIBRATION):
+        return baseline[CALIBRATION] / current[CALIBRATION]
+    return 1.0
+
+
+def merge(current: Dict[str, float], baseline: Dict[str, float], calibrated: Iterable[str] = ()) -> Dict[str, float]:
+    """Baseline updated with current results, calibrated entries kept from the old baseline are rescaled."""
+    factor = scale(current, baseline)
+    calibrated = set(calibrated)
+    kept = {name: value / factor if name in calibrated else value for name, value in baseline.items()}
+    return {**kept, **current}
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = 0.2, min_delta: float = 0.0,
+            calibrated: Iterable[str] = (), thresholds: Optional[Dict[str, float]] = None) -> List[Regression]:
+    """
+    Find results that got slower than the baseline.
+
+    :param current: Results of this run.
+    :param baseline: Stored baseline results.
+    :param threshold: Allowed relative slowdown, 0.2 means 20%.
+    :param min_delta: Ignore slowdowns smaller than this absolute amount.
+    :param calibrated: Names whose results are scaled by the calibration ratio first.
+    :param thresholds: Per-name thresholds that replace threshold.
+    :return: Regressions, benchmarks missing from either side are skipped.
+    """
+    regressions = []
+    factor = scale(current, baseline)
+    calibrated = set(calibrated)
+    thresholds = thresholds or {}
+    for name, value in current.items():
+        base = baseline.get(name)
+        if base is None or name == CALIBRATION:
+            continue
+        if name in calibrated:
+            value *= factor
+        if value > base * (1 + thresholds.get(name, threshold)) and value - base > min_delta:
+            regressions.append(Regression(name, base, value))
+    return regressions
+
+
+def report(current: Dict[str, float], baseline: Dict[str, float], regressions: List[Regression], unit: str,
+           calibrated: Iterable[str] = ()) -> None:
+    slow = {r.name for r in regressions}
+    factor = scale(current, baseline)
+    calibrated = set(calibrated)
+    for name, value in sorted(current.items()):
+        base = baseline.get(name)
+        # calibrated 的条目显示换算后的变化，其他按原始值
+        normalised = value * factor if name in calibrated else value
+        change = f'{(normalised / base - 1) * 100:+6.1f}%' if base else '   new'
+        flag = '  REGRESSION' if name in slow else ''
+        print(f'{name:<52} {value:>12.6g} {unit}  {change}{flag}')
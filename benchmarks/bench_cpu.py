@@ -0,0 +1,42 @@
+# CPU 路径的 microbenchmark
+import asyncio
+import random
+from functools import lru_cache
+
+from asycio_learn.asyncmanage.run_async import AsyncBackgroundExecutor
+from benchmarks.runner import benchmark
+from code_train.slide_window.slide_window01 import find_max_avg
+
+
+@lru_cache(maxsize=None)
+def nums() -> list:
+    rng = random.Random(42)
+    return [rng.randint(-1000, 1000) for _ in range(1_000_000)]
+
+
+@benchmark('slide_window.find_max_avg[1e6,k=100]', calibrate=True)
+def bench_find_max_avg():
+    find_max_avg(nums(), 100)
+
+
+async def noop(i: int) -> int:
+    return i
+
+
+@benchmark('executor.submit[10k tasks]', calibrate=True)
+async def bench_executor_submit():
+    async with AsyncBackgroundExecutor() as submit:
+        await asyncio.gather(*(submit(noop, i) for i in range(10_000)))
+
+
+@benchmark('executor.submit[10k tasks, max_concurrency=64]', calibrate=True)
+async def bench_executor_admission():
+    async with AsyncBackgroundExecutor(max_concurrency=64) as submit:
+        await asyncio.gather(*(submit(noop, i, __priority__=i % 3) for i in range(10_000)))
+
+
+# 只有几毫秒，校准之后前后两次仍会差到 1.9 倍
+@benchmark('executor.submit[10k tasks, 100 dedup keys]', calibrate=True, threshold=1.0)
+async def bench_executor_dedup():
+    async with AsyncBackgroundExecutor() as submit:
+        await asyncio.gather(*(submit(noop, i % 100, __key__=i % 100) for i in range(10_000)))
@@ -0,0 +1,86 @@
+# DatabaseConnector 的 benchmark，用 sqlite 内存库代替 MySQL/Postgres
+# 查询用的库第一次用到时才建（lru_cache），-k 只跑别的 benchmark 时不会花时间建库；
+# 建库落在第一次测量里，结果取最小值，不影响数字
+from functools import lru_cache
+
+from benchmarks.runner import IO_THRESHOLD, benchmark
+from code_train.interface_play.profiling_database import ProfilingConnector
+from code_train.interface_play.routing_database import ShardedConnector
+from code_train.interface_play.sqlite_database import SQLiteConnector
+
+COLUMNS = {
+    'id': 'INTEGER PRIMARY KEY AUTOINCREMENT',
+    'name': 'VARCHAR(100)',
+    'email': 'VARCHAR(100)',
+}
+
+
+def make_db(rows: int = 0) -> SQLiteConnector:
+    db = SQLiteConnector(':memory:')
+    db.create_table('users', COLUMNS)
+    for i in range(rows):
+        db.insert('users', {'name': f'user_{i}', 'email': f'user_{i}@example.com'})
+    return db
+
+
+@benchmark('db.sqlite.insert[5k rows]', threshold=IO_THRESHOLD)
+def bench_insert():
+    make_db(5000).close()
+
+
+@lru_cache(maxsize=None)
+def query_db() -> SQLiteConnector:
+    return make_db(20_000)
+
+
+@benchmark('db.sqlite.query[20k rows]', threshold=IO_THRESHOLD)
+def bench_query():
+    query_db().query('users')
+
+
+@benchmark('db.sqlite.query[conditions]', threshold=IO_THRESHOLD)
+def bench_query_conditions():
+    for i in range(200):
+        query_db().query('users', ['id', 'name'], f"name='user_{i * 50}'")
+
+
+@benchmark('db.sqlite.insert_then_delete[5k rows]', repeat=3, threshold=IO_THRESHOLD)
+def bench_delete():
+    db = make_db(5000)
+    db.delete('users', 'id % 2 = 0')
+    db.close()
+
+
+@lru_cache(maxsize=None)
+def profiled_db() -> ProfilingConnector:
+    return ProfilingConnector(query_db(), slow_threshold=1.0, sample_rate=0.01)
+
+
+@benchmark('db.sqlite.query[conditions, profiled 1%]', threshold=IO_THRESHOLD)
+def bench_query_conditions_profiled():
+    for i in range(200):
+        profiled_db().query('users', ['id', 'name'], f"name='user_{i * 50}'")
+
+
+def make_sharded_db(shards: int, rows: int) -> ShardedConnector:
+    db = ShardedConnector([SQLiteConnector(':memory:') for _ in range(shards)], {'users': 'id'})
+    db.create_table('users', {**COLUMNS, 'id': 'INTEGER PRIMARY KEY'})
+    for i in range(rows):
+        db.insert('users', {'id': i, 'name': f'user_{i}', 'email': f'user_{i}@example.com'})
+    return db
+
+
+@lru_cache(maxsize=None)
+def sharded_db() -> ShardedConnector:
+    return make_sharded_db(4, 20_000)
+
+
+@benchmark('db.sqlite.sharded.query[4 shards, 20k rows]', threshold=IO_THRESHOLD)
+def bench_sharded_query():
+    sharded_db().query('users')
+
+
+@benchmark('db.sqlite.sharded.query[key lookup]', threshold=IO_THRESHOLD)
+def bench_sharded_key_lookup():
+    for i in range(200):
+        sharded_db().query('users', ['id', 'name'], f'id = {i * 50}')
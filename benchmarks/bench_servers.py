@@ -0,0 +1,81 @@
+# 网络服务的负载测试，全部在本机：
+# - chat3 echo 服务器：进程内起一个同样行为的 echo 服务（02_asynce_Web.py 是脚本，import 就会启动）
+# - ConfigurableHTTPProxy：用本地 http.server 代替 configurable-http-proxy 的 API 端口
+import asyncio
+import importlib.util
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from asycio_learn.chat3.load_test import connect_per_request, load, start_echo_server
+from asycio_learn.chat3.mux_client import MuxClient
+from benchmarks.runner import IO_THRESHOLD, Skip, benchmark
+
+REQUESTS = 2000
+CONCURRENCY = 200
+
+
+async def load_checked(call):
+    for result in await load(call, REQUESTS, CONCURRENCY):
+        if isinstance(result, BaseException):
+            raise result
+
+
+@benchmark('chat3.echo[connect-per-request]', repeat=3, threshold=IO_THRESHOLD)
+async def bench_echo_connect_per_request():
+    server, port = await start_echo_server()
+    async with server:
+        await load_checked(lambda payload: connect_per_request('127.0.0.1', port, payload))
+
+
+@benchmark('chat3.echo[MuxClient pipelined]', repeat=3, threshold=IO_THRESHOLD)
+async def bench_echo_mux():
+    server, port = await start_echo_server()
+    async with server:
+        async with MuxClient('127.0.0.1', port, pool_size=4) as client:
+            await load_checked(client.request)
+
+
+class RoutesAPI(BaseHTTPRequestHandler):
+    def reply(self, status):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        body = json.dumps({'ok': True}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.reply(201)
+
+    def do_DELETE(self):
+        self.reply(200)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@benchmark('proxy.add_delete_route[200 routes]', repeat=3, threshold=IO_THRESHOLD)
+async def bench_proxy_routes():
+    if importlib.util.find_spec('aiohttp') is None:
+        raise Skip('aiohttp is not installed')
+    from proxy_learn.single_proxy import ConfigurableHTTPProxy
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), RoutesAPI)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        proxy = ConfigurableHTTPProxy(api_url=f'http://127.0.0.1:{httpd.server_address[1]}')
+        semaphore = asyncio.Semaphore(20)
+
+        async def one(i):
+            async with semaphore:
+                await proxy.add_route(f'/user/{i}/', 'http://127.0.0.1:8888/')
+                await proxy.delete_route(f'/user/{i}/')
+
+        await asyncio.gather(*(one(i) for i in range(200)))
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
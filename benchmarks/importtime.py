@@ -0,0 +1,70 @@
+# 统计模块 import 耗时 (python -X importtime)，和 importtime_baseline.json 比较
+# python -m benchmarks.importtime                    # 比较，超过阈值返回非 0
+# python -m benchmarks.importtime --update-baseline  # 改进之后更新基线
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict
+
+from benchmarks.baseline import compare, load_results, report, save_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, 'benchmarks', 'importtime_baseline.json')
+
+# CLI worker 会 import 的模块，可选依赖都应该在第一次使用时才加载
+MODULES = [
+    'asycio_learn.asyncmanage.run_async',
+    'code_train.interface_play.mysql_database',
+    'code_train.interface_play.postgres_database',
+    'proxy_learn.single_proxy',
+]
+
+
+def import_time_us(module: str) -> int:
+    """Cumulative import time of module in microseconds, from a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.strip() == module:
+            return int(cumulative)
+    raise RuntimeError(f'{module} not found in -X importtime output')
+
+
+def measure(runs: int) -> Dict[str, float]:
+    # 取多次的最小值，第一次可能包含 .pyc 编译
+    return {module: min(import_time_us(module) for _ in range(runs)) for module in MODULES}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save', help='write this run to a JSON file')
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--min-delta', type=float, default=2000, help='ignore slowdowns below this many us')
+    args = parser.parse_args()
+
+    current = measure(args.runs)
+    if args.save:
+        save_results(args.save, current)
+    if args.update_baseline or not os.path.exists(args.baseline):
+        save_results(args.baseline, current)
+        report(current, {}, [], 'us')
+        return 0
+
+    baseline = load_results(args.baseline)
+    regressions = compare(current, baseline, args.threshold, args.min_delta)
+    report(current, baseline, regressions, 'us')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
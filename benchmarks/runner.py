@@ -0,0 +1,103 @@
+# benchmark 注册和计时
+# @benchmark("name") 注册一个无参函数（普通函数或 async 函数），执行一次就是一次测量
+# 结果取 repeat 次中的最小值，单位秒
+# calibrate=True 只给纯 CPU 的 benchmark 用：结果按校准换算，抵消机器整体快慢；I/O 的 benchmark 不换算
+# threshold 覆盖这个 benchmark 允许的变慢比例，I/O 和负载测试波动大，用更宽的阈值
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+CALIBRATION = 'calibration'
+# sqlite / socket benchmarks: measured up to 1.85x run-to-run on a shared machine, calibration does not help them
+IO_THRESHOLD = 1.0
+
+
+class Skip(Exception):
+    """Raised by a benchmark whose optional dependency or service is missing."""
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable
+    repeat: int
+    calibrate: bool = False
+    threshold: Optional[float] = None
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, repeat: int = 5, calibrate: bool = False, threshold: Optional[float] = None):
+    def wrapper(func: Callable) -> Callable:
+        BENCHMARKS[name] = Benchmark(name, func, repeat, calibrate, threshold)
+        return func
+    return wrapper
+
+
+def calibrated() -> List[str]:
+    """Names of benchmarks whose results are in calibrated units."""
+    return [name for name, bench in BENCHMARKS.items() if bench.calibrate]
+
+
+def thresholds() -> Dict[str, float]:
+    """Per-benchmark thresholds that override the command line one."""
+    return {name: bench.threshold for name, bench in BENCHMARKS.items() if bench.threshold is not None}
+
+
+def run_once(bench: Benchmark) -> float:
+    start = time.perf_counter()
+    if inspect.iscoroutinefunction(bench.func):
+        asyncio.run(bench.func())
+    else:
+        bench.func()
+    return time.perf_counter() - start
+
+
+def _calibration_work() -> None:
+    # 固定的纯 Python 工作量，只用来衡量这台机器此刻有多快
+    total = 0
+    for i in range(200_000):
+        total += i * i % 7
+    sorted(str(i) for i in range(20_000))
+
+
+def calibrate(min_time: float = 0.5) -> float:
+    """Best time of a fixed pure-Python workload, used to normalise results across runs."""
+    bench = Benchmark(CALIBRATION, _calibration_work, 5)
+    timings: List[float] = []
+    while len(timings) < bench.repeat or sum(timings) < min_time:
+        timings.append(run_once(bench))
+    return min(timings)
+
+
+def run(pattern: Optional[str] = None, repeat: Optional[int] = None, min_time: float = 1.0,
+        calibration: Optional[float] = None) -> Dict[str, float]:
+    """
+    Run registered benchmarks whose name contains pattern.
+
+    :param pattern: Substring filter on benchmark names.
+    :param repeat: Override each benchmark's minimum repeat count.
+    :param min_time: Keep repeating a benchmark until this many seconds were spent on it.
+    :param calibration: calibrate() of this run; when given, calibrate again right before each
+        calibrate=True benchmark and scale its result to this speed, so drift during the run cancels out.
+    :return: Best time in seconds per benchmark, skipped ones are left out.
+    """
+    results: Dict[str, float] = {}
+    for name, bench in sorted(BENCHMARKS.items()):
+        if pattern and pattern not in name:
+            continue
+        timings: List[float] = []
+        local = calibrate(0.2) if calibration and bench.calibrate else None
+        try:
+            # at least `repeat` runs, and more for fast benchmarks until min_time is spent,
+            # the best of more samples is much less sensitive to machine noise
+            while len(timings) < (repeat or bench.repeat) or sum(timings) < min_time:
+                timings.append(run_once(bench))
+        except Skip as ex:
+            print(f'{name:<52} skipped: {ex}')
+            continue
+        results[name] = min(timings) * calibration / local if local else min(timings)
+    return results
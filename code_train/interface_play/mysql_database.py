@@ -1,4 +1,3 @@
-import mysql.connector
 from code_train.interface_play.database import DatabaseConnector
 # Concrete subclass for MySQL
 class MySQLConnector(DatabaseConnector):
@@ -12,6 +11,9 @@ class MySQLConnector(DatabaseConnector):
         :param user: Username.
         :param password: Password.
         """
+        # imported on first use, so importing this module stays cheap
+        import mysql.connector
+
         self.conn = mysql.connector.connect(
             host=host,
             port=port,
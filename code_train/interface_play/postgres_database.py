@@ -1,5 +1,3 @@
-import psycopg2
-from psycopg2 import sql
 from code_train.interface_play.database import DatabaseConnector
 # Concrete subclass for PostgreSQL
 class PostgresConnector(DatabaseConnector):
@@ -13,6 +11,9 @@ class PostgresConnector(DatabaseConnector):
         :param user: Username.
         :param password: Password.
         """
+        # imported on first use, so importing this module stays cheap
+        import psycopg2
+
         self.conn = psycopg2.connect(
             host=host,
             port=port,
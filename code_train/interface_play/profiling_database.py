@@ -0,0 +1,201 @@
+import random
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from code_train.interface_play.database import DatabaseConnector
+from code_train.interface_play.sqlite_database import SQLiteConnector
+
+_STRING = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Strip literals so statements that differ only in values share one entry.
+
+    :param sql: SQL text.
+    :return: Statement with literals replaced by '?'.
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('(?)', sql)
+    return _SPACES.sub(' ', sql).strip()
+
+
+def _payload_bytes(rows):
+    total = 0
+    for row in rows:
+        for value in row:
+            if isinstance(value, (str, bytes)):
+                total += len(value)
+            elif value is not None:
+                total += 8
+    return total
+
+
+@dataclass
+class StatementStats:
+    """
+    Aggregates of one statement.
+
+    calls, total_time, rows and bytes only count sampled calls; the
+    estimated_* properties scale them by 1 / sample_rate. slow_calls and
+    slow_time count every call over slow_threshold, sampled or not, and
+    max_time covers both kinds.
+    """
+    statement: str
+    sample_rate: float = 1.0
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    slow_calls: int = 0
+    slow_time: float = 0.0
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def estimated_calls(self):
+        return self.calls / self.sample_rate
+
+    @property
+    def estimated_total_time(self):
+        return self.total_time / self.sample_rate
+
+    @property
+    def estimated_rows(self):
+        return self.rows / self.sample_rate
+
+    @property
+    def estimated_bytes(self):
+        return self.bytes / self.sample_rate
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    sql: str
+    seconds: float
+    rows: int
+    explain: List[Any] = field(default_factory=list)
+
+
+# Profiling wrapper around any DatabaseConnector
+class ProfilingConnector(DatabaseConnector):
+    def __init__(self, connector, slow_threshold=0.1, sample_rate=0.01, explain_prefix=None, slow_log_size=100):
+        """
+        Wrap a connector and record latency per normalised statement.
+
+        Every call is timed; only a sample_rate fraction of calls is added to
+        the aggregates, so the per-call overhead is one clock read for the
+        rest (StatementStats.estimated_* scale the sampled sums back up).
+        Calls slower than slow_threshold are always counted in slow_calls
+        and logged together with their EXPLAIN output.
+
+        :param connector: DatabaseConnector to wrap.
+        :param slow_threshold: Seconds above which a call goes to the slow log.
+        :param sample_rate: Fraction of calls recorded in the aggregates (0..1).
+        :param explain_prefix: Statement prefix for plans, defaults to
+            'EXPLAIN QUERY PLAN' for SQLite and 'EXPLAIN' otherwise.
+        :param slow_log_size: Number of slow queries kept.
+        """
+        self.connector = connector
+        self.slow_threshold = slow_threshold
+        self.sample_rate = sample_rate
+        if explain_prefix is None:
+            explain_prefix = 'EXPLAIN QUERY PLAN' if isinstance(connector, SQLiteConnector) else 'EXPLAIN'
+        self.explain_prefix = explain_prefix
+        self.stats: Dict[str, StatementStats] = {}
+        self.slow_log: deque = deque(maxlen=slow_log_size)
+
+    def _explain(self, sql):
+        # wrappers such as RoutingConnector / ShardedConnector have no cursor of their own
+        cursor = getattr(self.connector, 'cursor', None)
+        if cursor is None:
+            return [f"no EXPLAIN available for {type(self.connector).__name__}"]
+        try:
+            cursor.execute(f"{self.explain_prefix} {sql}")
+            return cursor.fetchall()
+        except Exception as ex:
+            # a failed statement aborts the transaction on PostgreSQL
+            conn = getattr(self.connector, 'conn', None)
+            if conn is not None:
+                conn.rollback()
+            return [f"EXPLAIN failed: {ex}"]
+
+    def _profile(self, sql, call: Callable[[], Any], explain=True):
+        start = time.perf_counter()
+        result = call()
+        elapsed = time.perf_counter() - start
+
+        sampled = random.random() < self.sample_rate
+        slow = elapsed >= self.slow_threshold
+        if not sampled and not slow:
+            return result
+
+        statement = normalize_sql(sql)
+        rows = result if isinstance(result, list) else []
+        stats = self.stats.get(statement)
+        if stats is None:
+            stats = self.stats[statement] = StatementStats(statement, self.sample_rate)
+        stats.max_time = max(stats.max_time, elapsed)
+        if sampled:
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.rows += len(rows)
+            stats.bytes += _payload_bytes(rows)
+        if slow:
+            # counted exactly, a slow statement shows up even if none of its calls was sampled
+            stats.slow_calls += 1
+            stats.slow_time += elapsed
+            plan = self._explain(sql) if explain else []
+            self.slow_log.append(SlowQuery(statement, sql, elapsed, len(rows), plan))
+        return result
+
+    def top(self, n=10, by='total_time') -> List[StatementStats]:
+        """
+        Return the n heaviest statements.
+
+        The plain counters are sampled sums, use the estimated_* attributes
+        for whole-traffic numbers; the ranking is the same either way. Slow
+        calls that were not sampled only appear in max_time, slow_calls and
+        slow_time, rank by those to find them.
+
+        :param by: 'total_time', 'mean_time', 'max_time', 'calls', 'rows', 'bytes',
+            'slow_calls', 'slow_time' or one of the estimated_* attributes.
+        """
+        return sorted(self.stats.values(), key=lambda s: getattr(s, by), reverse=True)[:n]
+
+    def reset(self):
+        self.stats.clear()
+        self.slow_log.clear()
+
+    def create_table(self, table_name, columns):
+        self.connector.create_table(table_name, columns)
+
+    def query(self, table_name, columns='*', conditions=None):
+        columns_str = ', '.join(columns) if isinstance(columns, list) else columns
+        sql = f"SELECT {columns_str} FROM {table_name}"
+        if conditions:
+            sql += f" WHERE {conditions}"
+        return self._profile(sql, lambda: self.connector.query(table_name, columns, conditions))
+
+    def insert(self, table_name, data):
+        # values are bound as parameters, so the statement is already normalised
+        sql = f"INSERT INTO {table_name} ({', '.join(data.keys())}) VALUES ({', '.join(['?'] * len(data))})"
+        return self._profile(sql, lambda: self.connector.insert(table_name, data), explain=False)
+
+    def delete(self, table_name, conditions):
+        sql = f"DELETE FROM {table_name} WHERE {conditions}"
+        return self._profile(sql, lambda: self.connector.delete(table_name, conditions))
+
+    def close(self):
+        self.connector.close()
@@ -0,0 +1,221 @@
+import itertools
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from code_train.interface_play.database import DatabaseConnector
+
+
+def connection_errors():
+    """
+    Exceptions that mean a database is unreachable, not that the query is wrong.
+
+    ConnectionError / OSError plus OperationalError and InterfaceError of the
+    MySQL and PostgreSQL drivers that are already imported. sqlite3 is left out
+    because it reports SQL errors such as syntax errors as OperationalError.
+    """
+    errors = [ConnectionError, OSError]
+    for module_name in ('psycopg2', 'mysql.connector.errors'):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            errors += [module.OperationalError, module.InterfaceError]
+    return tuple(errors)
+
+
+# Read/write splitting over a primary and its read replicas
+class RoutingConnector(DatabaseConnector):
+    def __init__(self, primary, replicas=None, strategy='round_robin', mirror_writes=False, retry_after=5.0,
+                 failover_on=None):
+        """
+        Send reads to replicas and writes to the primary.
+
+        :param primary: DatabaseConnector that takes all writes.
+        :param replicas: DatabaseConnectors used for reads, the primary is used when empty.
+        :param strategy: 'round_robin' or 'least_latency' (lowest moving average query time).
+        :param mirror_writes: Also apply writes to every replica. Only for stand-ins
+            such as SQLite that do not replicate by themselves.
+        :param retry_after: Seconds a replica is skipped after a failed query, the
+            next read after that probes it again.
+        :param failover_on: Exception types that take a replica out and send the read
+            to the primary, defaults to connection_errors(). Other errors are raised
+            as they are and leave the replica in rotation.
+        """
+        if strategy not in ('round_robin', 'least_latency'):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.primary = primary
+        self.replicas = list(replicas or [])
+        self.strategy = strategy
+        self.mirror_writes = mirror_writes
+        self.retry_after = retry_after
+        self.failover_on = tuple(failover_on) if failover_on is not None else connection_errors()
+        self._next_replica = itertools.cycle(range(len(self.replicas)))
+        # exponential moving average of query latency per replica, 0.0 = not measured yet
+        self.latency = [0.0] * len(self.replicas)
+        # time.monotonic() until which a failed replica is skipped
+        self.down_until = [0.0] * len(self.replicas)
+
+    def _pick_replica(self):
+        """Index of the replica for the next read, None when all of them are cooling down."""
+        now = time.monotonic()
+        if self.strategy == 'round_robin':
+            for _ in range(len(self.replicas)):
+                index = next(self._next_replica)
+                if self.down_until[index] <= now:
+                    return index
+            return None
+        healthy = [index for index in range(len(self.replicas)) if self.down_until[index] <= now]
+        return min(healthy, key=self.latency.__getitem__) if healthy else None
+
+    def _write(self, method, *args):
+        getattr(self.primary, method)(*args)
+        if self.mirror_writes:
+            for replica in self.replicas:
+                getattr(replica, method)(*args)
+
+    def create_table(self, table_name, columns):
+        self._write('create_table', table_name, columns)
+
+    def query(self, table_name, columns='*', conditions=None):
+        index = self._pick_replica() if self.replicas else None
+        if index is None:
+            return self.primary.query(table_name, columns, conditions)
+        start = time.perf_counter()
+        try:
+            rows = self.replicas[index].query(table_name, columns, conditions)
+        except self.failover_on:
+            # an unreachable replica is skipped for retry_after seconds and the read served by the primary;
+            # its latency is forgotten so least_latency probes it first once it is back
+            self.down_until[index] = time.monotonic() + self.retry_after
+            self.latency[index] = 0.0
+            return self.primary.query(table_name, columns, conditions)
+        elapsed = time.perf_counter() - start
+        previous = self.latency[index]
+        self.latency[index] = elapsed if previous == 0.0 else 0.8 * previous + 0.2 * elapsed
+        return rows
+
+    def insert(self, table_name, data):
+        self._write('insert', table_name, data)
+
+    def delete(self, table_name, conditions):
+        self._write('delete', table_name, conditions)
+
+    def close(self):
+        self.primary.close()
+        for replica in self.replicas:
+            replica.close()
+
+
+_NUMERIC = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _number(text):
+    """int or float value of a plain numeric literal such as 07 or -1.50, None otherwise."""
+    if not _NUMERIC.fullmatch(text):
+        return None
+    return float(text) if '.' in text else int(text)
+
+
+def _shard_key(value):
+    """
+    Canonical form of a shard key, so 7, 7.0, '7' and the literal 07 hash alike.
+
+    Integral floats become int and numeric strings their number, matching how
+    the databases compare them against a numeric key column.
+    """
+    if isinstance(value, str):
+        number = _number(value.strip())
+        value = value if number is None else number
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+# Hash sharding of selected tables over several connectors
+class ShardedConnector(DatabaseConnector):
+    def __init__(self, shards, shard_keys, max_workers=None):
+        """
+        Spread rows of sharded tables over shards by a hash of their key column.
+
+        Tables not listed in shard_keys live on the first shard.
+
+        :param shards: DatabaseConnectors, e.g. one RoutingConnector per shard.
+        :param shard_keys: Dictionary of table name to key column.
+        :param max_workers: Threads used for scatter-gather, defaults to one per shard.
+        """
+        if not shards:
+            raise ValueError("At least one shard is required")
+        self.shards = list(shards)
+        self.shard_keys = dict(shard_keys)
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or len(self.shards))
+
+    def shard_for(self, value):
+        """Index of the shard that owns key value (hash of its canonical form, see _shard_key)."""
+        return zlib.crc32(str(_shard_key(value)).encode()) % len(self.shards)
+
+    def _single_shard(self, table_name, conditions):
+        # "key = literal" can be answered by the owning shard alone
+        key = self.shard_keys[table_name]
+        match = re.fullmatch(rf"\s*{re.escape(key)}\s*=\s*(?:'((?:[^']|'')*)'|({_NUMERIC.pattern}))\s*", conditions or '')
+        if match is None:
+            return None
+        if match.group(1) is not None:
+            value = match.group(1).replace("''", "'")
+            if not isinstance(_shard_key(value), str):
+                # '07' may equal 7 through column affinity or not, only scatter-gather is safe
+                return None
+        else:
+            value = _number(match.group(2))
+        return self.shards[self.shard_for(value)]
+
+    def _scatter(self, method, *args):
+        return [self.pool.submit(getattr(shard, method), *args) for shard in self.shards]
+
+    def create_table(self, table_name, columns):
+        for future in self._scatter('create_table', table_name, columns):
+            future.result()
+
+    def iter_query(self, table_name, columns='*', conditions=None):
+        """
+        Query all shards concurrently and yield rows as each shard answers.
+
+        Rows come in shard completion order, not in any global order.
+        """
+        if table_name not in self.shard_keys:
+            yield from self.shards[0].query(table_name, columns, conditions)
+            return
+        shard = self._single_shard(table_name, conditions)
+        if shard is not None:
+            yield from shard.query(table_name, columns, conditions)
+            return
+        for future in as_completed(self._scatter('query', table_name, columns, conditions)):
+            yield from future.result()
+
+    def query(self, table_name, columns='*', conditions=None):
+        return list(self.iter_query(table_name, columns, conditions))
+
+    def insert(self, table_name, data):
+        if table_name not in self.shard_keys:
+            self.shards[0].insert(table_name, data)
+            return
+        key = self.shard_keys[table_name]
+        if key not in data:
+            raise ValueError(f"Insert into sharded table {table_name} needs a value for {key}")
+        self.shards[self.shard_for(data[key])].insert(table_name, data)
+
+    def delete(self, table_name, conditions):
+        if table_name not in self.shard_keys:
+            self.shards[0].delete(table_name, conditions)
+            return
+        shard = self._single_shard(table_name, conditions)
+        if shard is not None:
+            shard.delete(table_name, conditions)
+            return
+        for future in self._scatter('delete', table_name, conditions):
+            future.result()
+
+    def close(self):
+        self.pool.shutdown()
+        for shard in self.shards:
+            shard.close()
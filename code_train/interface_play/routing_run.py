@@ -0,0 +1,35 @@
+from code_train.interface_play.routing_database import RoutingConnector, ShardedConnector
+from code_train.interface_play.sqlite_database import SQLiteConnector
+
+# 2 shards, each a primary with 2 read replicas, all SQLite stand-ins
+# (SQLite does not replicate, so writes are mirrored to the replicas)
+db = ShardedConnector(
+    shards=[
+        RoutingConnector(SQLiteConnector(), [SQLiteConnector(), SQLiteConnector()], mirror_writes=True),
+        RoutingConnector(SQLiteConnector(), [SQLiteConnector(), SQLiteConnector()],
+                         strategy='least_latency', mirror_writes=True),
+    ],
+    shard_keys={'users': 'id'},
+)
+
+# Create a table on every shard
+db.create_table('users', {
+    'id': 'INTEGER PRIMARY KEY',
+    'name': 'VARCHAR(100)',
+    'email': 'VARCHAR(100)'
+})
+
+# Insert data, each row goes to the shard that owns its id
+for i in range(10):
+    db.insert('users', {'id': i, 'name': f'user_{i}', 'email': f'user_{i}@example.com'})
+
+# Query data: scatter-gather over all shards, or a single shard for "id = ..."
+print(sorted(db.query('users')))
+print(db.query('users', ['name'], 'id = 3'))
+
+# Delete data
+db.delete('users', "name='user_1'")
+print(len(db.query('users')))
+
+# Close the connection
+db.close()
@@ -0,0 +1,24 @@
+from code_train.interface_play.sqlite_database import SQLiteConnector
+
+# Initialize the SQLite connector (in memory, no server needed)
+db = SQLiteConnector(':memory:')
+
+# Create a table
+db.create_table('users', {
+    'id': 'INTEGER PRIMARY KEY AUTOINCREMENT',
+    'name': 'VARCHAR(100)',
+    'email': 'VARCHAR(100)'
+})
+
+# Insert data
+db.insert('users', {'name': 'John Doe', 'email': 'john@example.com'})
+
+# Query data
+users = db.query('users')
+print(users)
+
+# Delete data
+db.delete('users', "name='John Doe'")
+
+# Close the connection
+db.close()
@@ -0,0 +1,62 @@
+# 对比逐条 User(**data) 和批量校验的吞吐
+# python -m dependencies_learn.base_know.bench_pydantic --records 1000000
+import argparse
+import json
+import time
+
+from pydantic import ValidationError
+
+from dependencies_learn.base_know.pydantic_batch import (
+    construct_many,
+    validate_json_lines,
+    validate_json_many,
+    validate_many,
+)
+from dependencies_learn.base_know.pydantic_demo import User
+
+
+def per_record_loop(records):
+    users, errors = [], {}
+    for i, user_data in enumerate(records):
+        try:
+            users.append(User(**user_data))
+        except ValidationError as e:
+            errors[i] = e.errors()
+    return users
+
+
+def per_record_json(lines):
+    users = []
+    for line in lines:
+        users.append(User(**json.loads(line)))
+    return users
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = [{'id': str(i), 'name': f'user_{i}', 'age': i % 90} for i in range(args.records)]
+    lines = [json.dumps(r).encode() for r in records]
+    # construct_many 只接受已经校验过、类型正确的数据
+    trusted = [{'id': i, 'name': f'user_{i}', 'age': i % 90} for i in range(args.records)]
+    payload = json.dumps(records).encode()
+
+    cases = [
+        ('per-record User(**d)', lambda: per_record_loop(records)),
+        ('per-record json.loads', lambda: per_record_json(lines)),
+        ('validate_many', lambda: validate_many(records).valid),
+        ('validate_json_many', lambda: validate_json_many(payload).valid),
+        ('validate_json_lines', lambda: [u for r in validate_json_lines(lines) for u in r.valid]),
+        ('construct_many', lambda: construct_many(trusted)),
+    ]
+    for name, func in cases:
+        start = time.perf_counter()
+        users = func()
+        total = time.perf_counter() - start
+        print(f"{name:<24} {len(users)} records in {total:.3f}s ({len(users) / total:,.0f} records/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# 对比普通 property 类和 slotted_model：每百万个对象的内存、热读取速度
+# python -m dependencies_learn.base_know.bench_slotted_model --objects 1000000
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from dependencies_learn.base_know import class_mothod_learn, property_demo, property_demo2_setter
+from dependencies_learn.base_know import slotted_model
+
+
+def memory_per_million(factory, objects):
+    gc.collect()
+    tracemalloc.start()
+    # small ints are cached by CPython, so only the instances themselves are counted
+    items = [factory(i % 100) for i in range(objects)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / objects * 1_000_000 / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--objects', type=int, default=1_000_000)
+    parser.add_argument('--reads', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print("memory per 1M objects")
+    for label, factory in [
+        ('property_demo.Circle', lambda i: property_demo.Circle(i)),
+        ('property_demo2_setter.Circle', lambda i: property_demo2_setter.Circle(i)),
+        ('slotted_model.Circle', lambda i: slotted_model.Circle(i)),
+        ('class_mothod_learn.Vehicle', lambda i: class_mothod_learn.Vehicle('car', i)),
+        ('slotted_model.Vehicle', lambda i: slotted_model.Vehicle('car', i)),
+    ]:
+        print(f"  {label:<30} {memory_per_million(factory, args.objects):8.1f} MiB")
+
+    print(f"hot reads ({args.reads} per case)")
+    plain, setter, slotted = property_demo.Circle(5), property_demo2_setter.Circle(5), slotted_model.Circle(5)
+    slotted.area
+    for label, stmt, obj in [
+        ('property_demo.Circle.area', 'c.area', plain),
+        ('slotted_model.Circle.area', 'c.area', slotted),
+        ('property_demo2_setter.Circle.radius', 'c.radius', setter),
+        ('slotted_model.Circle.radius', 'c.radius', slotted),
+    ]:
+        total = min(timeit.repeat(stmt, globals={'c': obj}, number=args.reads, repeat=5))
+        print(f"  {label:<36} {total / args.reads * 1e9:6.1f} ns/read")
+
+
+if __name__ == '__main__':
+    main()
@@ -18,11 +18,12 @@ class Vehicle:
     def truck(cls):
         return cls('truck', 6)
 
-# 使用类方法创建不同类型的车辆
-bike = Vehicle.motorcycle()
-sedan = Vehicle.car()
-big_truck = Vehicle.truck()
+if __name__ == '__main__':
+    # 使用类方法创建不同类型的车辆
+    bike = Vehicle.motorcycle()
+    sedan = Vehicle.car()
+    big_truck = Vehicle.truck()
 
-print(bike.category, bike.wheels)  # 输出: motorcycle 2
-print(sedan.category, sedan.wheels)  # 输出: car 4
-print(big_truck.category, big_truck.wheels)  # 输出: truck 6
+    print(bike.category, bike.wheels)  # 输出: motorcycle 2
+    print(sedan.category, sedan.wheels)  # 输出: car 4
+    print(big_truck.category, big_truck.wheels)  # 输出: truck 6
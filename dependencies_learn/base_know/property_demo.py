@@ -15,9 +15,10 @@ class Circle:
         """Calculate and return the area of the circle."""
         return 3.14159 * (self._radius ** 2)
 
-# 创建一个圆的实例
-circle = Circle(5)
+if __name__ == '__main__':
+    # 创建一个圆的实例
+    circle = Circle(5)
 
-# 访问属性
-print(circle.radius)  # 输出: 5
-print(circle.area)    # 输出: 78.53975
+    # 访问属性
+    print(circle.radius)  # 输出: 5
+    print(circle.area)    # 输出: 78.53975
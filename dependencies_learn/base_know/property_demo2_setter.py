@@ -12,13 +12,14 @@ class Circle:
             raise ValueError("Radius cannot be negative")
         self._radius = value
 
-# 创建一个圆的实例
-circle = Circle(5)
-print(circle.radius)  # 输出: 5
+if __name__ == '__main__':
+    # 创建一个圆的实例
+    circle = Circle(5)
+    print(circle.radius)  # 输出: 5
 
-# 修改半径
-circle.radius = 10
-print(circle.radius)  # 输出: 10
+    # 修改半径
+    circle.radius = 10
+    print(circle.radius)  # 输出: 10
 
-# 尝试设置一个负值
-circle.radius = -2  # 将引发 ValueError
+    # 尝试设置一个负值
+    circle.radius = -2  # 将引发 ValueError
@@ -0,0 +1,118 @@
+# 批量校验：一次调用校验整批数据，而不是 for 循环里 User(**user_data)
+# - TypeAdapter(list[User]) 一次进入 pydantic-core，没有逐条的 Python 调用开销
+# - validate_json 直接吃 JSON bytes，不先 json.loads 成 dict
+# - 出错时不在第一条就抛异常，而是收集每条记录的错误，其余记录照常返回
+# - construct_many 给已经校验过的可信数据用，完全跳过校验（不做类型转换）。
+#   对 User 这种简单模型它并不比 validate_many 快，pydantic-core 的校验本身就很快
+# - JSON lines 逐行 model_validate_json，每行必须正好是一条记录，和拼成一个数组校验一样快
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from dependencies_learn.base_know.pydantic_demo import User
+
+_USERS = TypeAdapter(List[User])
+
+
+@dataclass
+class BatchResult:
+    valid: List[User] = field(default_factory=list)
+    # 记录在输入中的下标 -> 该记录的错误列表
+    errors: Dict[int, List[dict]] = field(default_factory=dict)
+
+
+def _split_errors(records: List[Any], exc: ValidationError, offset: int) -> BatchResult:
+    errors: Dict[int, List[dict]] = {}
+    for err in exc.errors(include_url=False):
+        index, *loc = err['loc']
+        errors.setdefault(offset + index, []).append({**err, 'loc': tuple(loc)})
+    good = [record for i, record in enumerate(records) if offset + i not in errors]
+    return BatchResult(_USERS.validate_python(good), errors)
+
+
+def validate_many(records: List[dict], offset: int = 0) -> BatchResult:
+    """
+    Validate a list of dicts in one call, collecting per-record errors.
+
+    :param records: Raw user records.
+    :param offset: Added to record indices in the error map.
+    :return: BatchResult with valid users and errors by index.
+    """
+    try:
+        return BatchResult(_USERS.validate_python(records))
+    except ValidationError as exc:
+        return _split_errors(records, exc, offset)
+
+
+def validate_json_many(data: bytes, offset: int = 0) -> BatchResult:
+    """
+    Validate a JSON array of user records straight from bytes.
+
+    Raises ValidationError only when the document itself is broken
+    (invalid JSON or not an array); bad records are reported in errors.
+
+    :param data: JSON array bytes.
+    :param offset: Added to record indices in the error map.
+    :return: BatchResult with valid users and errors by index.
+    """
+    try:
+        return BatchResult(_USERS.validate_json(data))
+    except ValidationError as exc:
+        if any(not err['loc'] for err in exc.errors()):
+            raise
+        # 只有出错的这一批才会解析成 Python 对象
+        return _split_errors(from_json(data), exc, offset)
+
+
+def validate_stream(records: Iterable[dict], batch_size: int = 10000) -> Iterator[BatchResult]:
+    """
+    Validate a stream of dicts in batches, error indices are global.
+
+    :param records: Iterable of raw user records.
+    :param batch_size: Records validated per call.
+    :return: Iterator of BatchResult, one per batch.
+    """
+    it = iter(records)
+    offset = 0
+    while batch := list(islice(it, batch_size)):
+        yield validate_many(batch, offset)
+        offset += len(batch)
+
+
+def validate_json_lines(lines: Iterable[bytes], batch_size: int = 10000) -> Iterator[BatchResult]:
+    """
+    Validate JSON-lines input in batches without building intermediate dicts.
+
+    Every line is validated on its own with User.model_validate_json, so a
+    line holding two objects or half an object is an error at its own index.
+    Joining lines into one array is no faster and would let such lines
+    shift the indices of the rest of the batch.
+
+    :param lines: Iterable of JSON object bytes, one record per item.
+    :param batch_size: Records per yielded BatchResult.
+    :return: Iterator of BatchResult, one per batch.
+    """
+    it = iter(lines)
+    offset = 0
+    while batch := list(islice(it, batch_size)):
+        result = BatchResult()
+        for i, line in enumerate(batch):
+            try:
+                result.valid.append(User.model_validate_json(line))
+            except ValidationError as exc:
+                result.errors[offset + i] = exc.errors(include_url=False)
+        yield result
+        offset += len(batch)
+
+
+def construct_many(records: Iterable[dict]) -> List[User]:
+    """
+    Build users from trusted, already validated data without validation.
+
+    Just ``User.model_construct(**record)`` per record, it is not faster than
+    validate_many for this model.
+    """
+    return [User.model_construct(**record) for record in records]
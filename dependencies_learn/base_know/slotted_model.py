@@ -0,0 +1,178 @@
+# 带缓存的派生属性 + __slots__ 紧凑实例
+# - fields 声明普通属性，全部放进 __slots__，实例没有 __dict__
+# - @cached('radius') 声明派生属性：第一次读取时计算，结果存进同名 slot，之后读取就是普通的 slot 读取
+# - 给 radius 赋值时，所有（直接或间接）依赖 radius 的缓存自动清掉
+# - @validates('radius') 在赋值前校验，和 property_demo2_setter.py 的 setter 作用一样
+from typing import Callable, Dict, Tuple
+
+
+class cached:
+    """Mark a method as a cached derived attribute of the given source attributes."""
+
+    def __init__(self, *sources: str):
+        self.sources = sources
+
+    def __call__(self, func: Callable) -> 'cached':
+        self.func = func
+        self.__doc__ = func.__doc__
+        return self
+
+
+def validates(name: str):
+    """Mark a method as validator of field name, it returns the value to store."""
+    def wrapper(func: Callable) -> Callable:
+        func._validates = name
+        return func
+    return wrapper
+
+
+class ModelMeta(type):
+    def __new__(mcs, name, bases, namespace):
+        computed: Dict[str, Callable] = {}
+        sources: Dict[str, Tuple[str, ...]] = {}
+        validators: Dict[str, Callable] = {}
+        existing_slots = set()
+        for base in reversed(bases):
+            computed.update(getattr(base, '_computed', {}))
+            sources.update(getattr(base, '_sources', {}))
+            validators.update(getattr(base, '_validators', {}))
+            for klass in base.__mro__:
+                existing_slots.update(klass.__dict__.get('__slots__', ()))
+
+        for attr, value in list(namespace.items()):
+            if isinstance(value, cached):
+                # the slot of the same name holds the cached value
+                del namespace[attr]
+                computed[attr] = value.func
+                sources[attr] = value.sources
+            elif callable(value) and hasattr(value, '_validates'):
+                validators[value._validates] = value
+
+        fields = tuple(namespace.get('fields', ()))
+        namespace['__slots__'] = tuple(
+            slot for slot in (*fields, *computed) if slot not in existing_slots
+        )
+
+        # source attribute -> every cached attribute that depends on it, directly or not
+        dependents: Dict[str, Tuple[str, ...]] = {}
+        for attr in {src for srcs in sources.values() for src in srcs}:
+            found, stack = [], [attr]
+            while stack:
+                current = stack.pop()
+                for target, srcs in sources.items():
+                    if current in srcs and target not in found:
+                        found.append(target)
+                        stack.append(target)
+            dependents[attr] = tuple(found)
+
+        namespace['_computed'] = computed
+        namespace['_sources'] = sources
+        namespace['_validators'] = validators
+        namespace['_dependents'] = dependents
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Model(metaclass=ModelMeta):
+    __slots__ = ()
+    fields: Tuple[str, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self.fields):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self.fields)} positional arguments")
+        kwargs.update(zip(self.fields, args))
+        for name in self.fields:
+            if name not in kwargs:
+                raise TypeError(f"{type(self).__name__} missing argument: {name}")
+            setattr(self, name, kwargs.pop(name))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} got unexpected arguments: {', '.join(kwargs)}")
+
+    def __getattr__(self, name):
+        # only called when the slot is empty: compute the cached value once
+        compute = type(self)._computed.get(name)
+        if compute is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = compute(self)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        cls = type(self)
+        if name in cls._computed:
+            raise AttributeError(f"{name} is computed from {', '.join(cls._sources[name])}")
+        validator = cls._validators.get(name)
+        if validator is not None:
+            value = validator(self, value)
+        object.__setattr__(self, name, value)
+        for dependent in cls._dependents.get(name, ()):
+            try:
+                object.__delattr__(self, dependent)
+            except AttributeError:
+                pass
+
+    def __getstate__(self):
+        # only fields: cached slots would go through __setattr__ and are cheap to recompute
+        return {name: getattr(self, name) for name in self.fields if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        # values were validated when first set, copy/pickle restore them as they are
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values})"
+
+
+class Circle(Model):
+    fields = ('radius',)
+
+    @validates('radius')
+    def _check_radius(self, value):
+        if value < 0:
+            raise ValueError("Radius cannot be negative")
+        return value
+
+    @cached('radius')
+    def area(self):
+        """Calculate and return the area of the circle."""
+        return 3.14159 * (self.radius ** 2)
+
+    @cached('radius')
+    def diameter(self):
+        return 2 * self.radius
+
+    @cached('diameter')
+    def circumference(self):
+        return 3.14159 * self.diameter
+
+
+class Vehicle(Model):
+    fields = ('category', 'wheels')
+
+    @classmethod
+    def motorcycle(cls):
+        return cls('motorcycle', 2)
+
+    @classmethod
+    def car(cls):
+        return cls('car', 4)
+
+    @classmethod
+    def truck(cls):
+        return cls('truck', 6)
+
+
+if __name__ == '__main__':
+    circle = Circle(5)
+    print(circle.area)           # 输出: 78.53975，第一次读取时计算
+    print(circle.circumference)  # 输出: 31.4159，依赖 diameter
+    circle.radius = 10           # area / diameter / circumference 的缓存都被清掉
+    print(circle.area)           # 输出: 314.159
+    print(circle.circumference)  # 输出: 62.8318
+    print(hasattr(circle, '__dict__'))  # 输出: False
+
+    bike = Vehicle.motorcycle()
+    print(bike.category, bike.wheels)  # 输出: motorcycle 2
+
+    circle.radius = -2  # 将引发 ValueError
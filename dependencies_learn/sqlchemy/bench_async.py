@@ -0,0 +1,80 @@
+# 几百个并发读写：asyncio + AsyncSession 对比 同步 engine + 线程池
+# python -m dependencies_learn.sqlchemy.bench_async --url sqlite:///bench.db --async-url sqlite+aiosqlite:///bench.db
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import insert, select
+
+from dependencies_learn.sqlchemy.async_engine import (
+    ASYNC_DATABASE_URL,
+    create_tables,
+    make_async_engine,
+    make_task_scoped_session,
+)
+from dependencies_learn.sqlchemy.engine import DATABASE_URL, make_engine, make_session_factory
+from dependencies_learn.sqlchemy.models import Base, User
+
+
+def sync_job(session_factory, i):
+    with session_factory() as session:
+        if i % 2:
+            session.execute(insert(User), [{'name': f'sync_{i}', 'age': i % 90}])
+            session.commit()
+        else:
+            session.scalars(select(User).where(User.age == i % 90).limit(20)).all()
+
+
+async def async_job(scoped, i):
+    session = scoped()
+    try:
+        if i % 2:
+            await session.execute(insert(User), [{'name': f'async_{i}', 'age': i % 90}])
+            await session.commit()
+        else:
+            (await session.scalars(select(User).where(User.age == i % 90).limit(20))).all()
+    finally:
+        await scoped.remove()
+
+
+def run_sync(url, jobs, pool_size):
+    engine = make_engine(url, pool_size=pool_size, max_overflow=0)
+    Base.metadata.create_all(engine)
+    session_factory = make_session_factory(engine)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=pool_size) as pool:
+        list(pool.map(lambda i: sync_job(session_factory, i), range(jobs)))
+    total = time.perf_counter() - start
+    engine.dispose()
+    return total
+
+
+async def run_async(url, jobs, pool_size):
+    engine = make_async_engine(url, pool_size=pool_size, max_overflow=0)
+    await create_tables(engine)
+    scoped = make_task_scoped_session(engine)
+    start = time.perf_counter()
+    await asyncio.gather(*(async_job(scoped, i) for i in range(jobs)))
+    total = time.perf_counter() - start
+    await engine.dispose()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default=DATABASE_URL)
+    parser.add_argument('--async-url', default=ASYNC_DATABASE_URL)
+    parser.add_argument('--jobs', type=int, default=500)
+    parser.add_argument('--pool-size', type=int, default=10)
+    args = parser.parse_args()
+
+    for name, total in [
+        ('sync + thread pool', run_sync(args.url, args.jobs, args.pool_size)),
+        ('asyncio + AsyncSession', asyncio.run(run_async(args.async_url, args.jobs, args.pool_size))),
+    ]:
+        print(f"{name:<24} {args.jobs} jobs in {total:.3f}s ({args.jobs / total:,.0f} jobs/s)")
+
+
+if __name__ == '__main__':
+    main()
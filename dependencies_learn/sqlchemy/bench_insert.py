@@ -0,0 +1,56 @@
+# 对比三种写法插入 10^5 行：逐行 ORM / bulk ORM / Core executemany
+# python -m dependencies_learn.sqlchemy.bench_insert --url sqlite:///bench.db
+import argparse
+import time
+
+from sqlalchemy import delete
+
+from dependencies_learn.sqlchemy.bulk_write import bulk_insert_users_core, bulk_insert_users_orm
+from dependencies_learn.sqlchemy.engine import DATABASE_URL, make_engine, make_session_factory
+from dependencies_learn.sqlchemy.models import Base, User
+
+
+def make_rows(n: int):
+    return ({'name': f'user_{i}', 'age': i % 90} for i in range(n))
+
+
+def row_by_row_orm(session_factory, engine, n):
+    with session_factory() as session:
+        for row in make_rows(n):
+            session.add(User(**row))
+            session.flush()
+        session.commit()
+
+
+def bulk_orm(session_factory, engine, n):
+    with session_factory() as session:
+        bulk_insert_users_orm(session, make_rows(n))
+
+
+def core(session_factory, engine, n):
+    bulk_insert_users_core(engine, make_rows(n))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default=DATABASE_URL)
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = make_engine(args.url)
+    Base.metadata.create_all(engine)
+    session_factory = make_session_factory(engine)
+
+    for name, func in [('row-by-row ORM', row_by_row_orm), ('bulk ORM', bulk_orm), ('Core executemany', core)]:
+        with engine.begin() as conn:
+            conn.execute(delete(User.__table__))
+        start = time.perf_counter()
+        func(session_factory, engine, args.rows)
+        total = time.perf_counter() - start
+        print(f"{name:<20} {args.rows} rows in {total:.3f}s ({args.rows / total:,.0f} rows/s)")
+
+    engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
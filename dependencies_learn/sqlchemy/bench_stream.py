@@ -0,0 +1,62 @@
+# 对比 .all() 和流式读取的峰值内存和吞吐
+# python -m dependencies_learn.sqlchemy.bench_stream --url sqlite:///bench.db --rows 1000000
+import argparse
+import time
+import tracemalloc
+
+from sqlalchemy import delete, func, select
+
+from dependencies_learn.sqlchemy.bulk_write import bulk_insert_users_core
+from dependencies_learn.sqlchemy.engine import DATABASE_URL, make_engine, make_session_factory
+from dependencies_learn.sqlchemy.models import Base, User
+from dependencies_learn.sqlchemy.stream_read import stream_user_columns, stream_user_objects
+
+
+def load_all(session):
+    for user in session.query(User).filter(User.age >= 18).all():
+        yield user
+
+
+def measure(name, rows_iter):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = 0
+    for _ in rows_iter:
+        count += 1
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<22} {count} rows in {total:.3f}s ({count / total:,.0f} rows/s), peak {peak / 2**20:.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default=DATABASE_URL)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    engine = make_engine(args.url)
+    Base.metadata.create_all(engine)
+    session_factory = make_session_factory(engine)
+
+    with session_factory() as session:
+        count = session.scalar(select(func.count()).select_from(User))
+    if count != args.rows:
+        with engine.begin() as conn:
+            conn.execute(delete(User.__table__))
+        bulk_insert_users_core(engine, ({'name': f'user_{i}', 'age': i % 90} for i in range(args.rows)))
+
+    cases = [
+        ('.all() full ORM', load_all),
+        ('yield_per load_only', stream_user_objects),
+        ('yield_per columns', stream_user_columns),
+    ]
+    for name, reader in cases:
+        with session_factory() as session:
+            measure(name, reader(session))
+
+    engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
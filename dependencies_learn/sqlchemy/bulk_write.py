@@ -0,0 +1,52 @@
+# 批量写入 User(users2)：不要一行一个 commit
+# - Core: insert(table) + 参数列表 => executemany，一批一次往返
+# - ORM:  bulk_insert_mappings，跳过 unit of work 和对象标识管理
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from dependencies_learn.sqlchemy.models import User
+
+
+def chunked(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def bulk_insert_users_core(engine: Engine, rows: Iterable[dict], batch_size: int = 5000) -> int:
+    """
+    Insert users through Core executemany, one transaction for all batches.
+
+    :param engine: Engine to write through.
+    :param rows: Iterable of dicts with 'name' and 'age'.
+    :param batch_size: Rows sent per executemany call.
+    :return: Number of rows inserted.
+    """
+    stmt = insert(User.__table__)
+    total = 0
+    with engine.begin() as conn:
+        for batch in chunked(rows, batch_size):
+            conn.execute(stmt, batch)
+            total += len(batch)
+    return total
+
+
+def bulk_insert_users_orm(session: Session, rows: Iterable[dict], batch_size: int = 5000) -> int:
+    """
+    Insert users through Session.bulk_insert_mappings and commit once.
+
+    :param session: Session to write through.
+    :param rows: Iterable of dicts with 'name' and 'age'.
+    :param batch_size: Rows flushed per bulk call.
+    :return: Number of rows inserted.
+    """
+    total = 0
+    for batch in chunked(rows, batch_size):
+        session.bulk_insert_mappings(User, batch)
+        total += len(batch)
+    session.commit()
+    return total
@@ -0,0 +1,20 @@
+# 表结构集中定义，demo01 的 Core 表 users 和 demo02 的 ORM 模型 User(users2)
+from sqlalchemy import Column, Integer, MetaData, String, Table
+from sqlalchemy.orm import declarative_base
+
+metadata = MetaData()
+
+users = Table('users', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('name', String),
+              Column('age', Integer))
+
+Base = declarative_base(metadata=metadata)
+
+
+class User(Base):
+    __tablename__ = 'users2'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    age = Column(Integer)
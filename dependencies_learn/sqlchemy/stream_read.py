@@ -0,0 +1,65 @@
+# 流式读取：.all() 会把整张结果集读进内存，还要给每一行建 ORM 对象
+# - stream_results=True: postgres/mysql 用服务端游标，一批一批从数据库拉
+# - yield_per: 每次只缓冲 batch_size 行，ORM 也按批产出对象
+# - 只取需要的列（Core 行 / load_only），少建对象、少传数据
+from typing import Iterator
+
+from sqlalchemy import Row, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, load_only
+
+from dependencies_learn.sqlchemy.models import User, users
+
+
+def stream_users(engine: Engine, min_age: int = 18, batch_size: int = 1000) -> Iterator[Row]:
+    """
+    Stream (id, name, age) rows of the Core users table in constant memory.
+
+    :param engine: Engine to read through.
+    :param min_age: Only rows with age >= min_age.
+    :param batch_size: Rows fetched from the server cursor per round trip.
+    :return: Iterator of Core rows.
+    """
+    query = select(users.c.id, users.c.name, users.c.age).where(users.c.age >= min_age)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+        for partition in result.partitions():
+            yield from partition
+
+
+def stream_user_columns(session: Session, *columns, min_age: int = 18, batch_size: int = 1000) -> Iterator[Row]:
+    """
+    Stream selected User columns as plain rows, no ORM identities are built.
+
+    :param session: Session to read through.
+    :param columns: User attributes to select, defaults to name and age.
+    :param min_age: Only users with age >= min_age.
+    :param batch_size: Rows fetched from the server cursor per round trip.
+    :return: Iterator of rows.
+    """
+    columns = columns or (User.name, User.age)
+    query = select(*columns).where(User.age >= min_age).execution_options(yield_per=batch_size)
+    yield from session.execute(query)
+
+
+def stream_user_objects(session: Session, *attrs, min_age: int = 18, batch_size: int = 1000) -> Iterator[User]:
+    """
+    Stream User objects with only the given attributes loaded.
+
+    The session's identity map holds clean objects weakly, so batches the
+    caller has finished with are garbage collected.
+
+    :param session: Session to read through.
+    :param attrs: User attributes to load, defaults to name and age.
+    :param min_age: Only users with age >= min_age.
+    :param batch_size: Objects fetched and yielded per batch.
+    :return: Iterator of User objects.
+    """
+    attrs = attrs or (User.name, User.age)
+    query = (
+        select(User)
+        .options(load_only(*attrs))
+        .where(User.age >= min_age)
+        .execution_options(yield_per=batch_size)
+    )
+    yield from session.scalars(query)
@@ -0,0 +1,80 @@
+# 批量修改时合并通知：
+# with hold_notifications(objs):
+#     ...  # 这里的赋值不会触发 on_trait_change
+# 退出时每个对象每个属性只发一次 (进入时的值 -> 最终值)，值没变的属性不发
+# 原理：_trait_change_notify(False) 关掉对象的通知，退出时用 trait_property_changed 补发
+# 通知是按对象整体关掉的，所以每个对象所有会发通知的 trait 都要记快照；Event 没有值，block 里触发的 Event 会丢失
+# 只管整个属性的赋值：List/Dict/Set 的原地修改 (obj.xs.append(1)) 不会合并——observe('xs:items') 照常立即收到，
+# on_trait_change 的 xs_items 在 block 里被关掉、退出时也不补发（容器还是同一个对象，比较不出变化）
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from traits.api import HasTraits
+
+_held = set()
+
+
+def _snapshot(obj: HasTraits) -> Dict[str, object]:
+    names = obj.trait_names(type=lambda trait_type: trait_type != 'event')
+    return {name: getattr(obj, name) for name in names}
+
+
+def _changed(old: object, new: object) -> bool:
+    if new is old:
+        return False
+    try:
+        return bool(new != old)
+    except Exception:
+        # e.g. numpy arrays: != is elementwise and has no single truth value
+        return True
+
+
+def _deliver(changes: List[Tuple[HasTraits, str, object, object]]) -> None:
+    for obj, name, old, new in changes:
+        obj.trait_property_changed(name, old, new)
+
+
+@contextmanager
+def hold_notifications(
+    objs: Iterable[HasTraits],
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+):
+    """
+    Suppress trait change notifications on objs and deliver coalesced ones on exit.
+
+    Only assignments to a trait are held. In-place changes of List, Dict
+    and Set traits (``obj.xs.append(1)``) are not coalesced: observe()
+    items handlers still fire immediately, on_trait_change items handlers
+    are dropped, and no event is sent on exit because the trait still
+    holds the same container object.
+
+    :param objs: HasTraits objects to hold.
+    :param loop: If given, notifications are scheduled on this event loop
+        (thread safe) instead of being delivered before the block returns.
+    """
+    snapshots = []
+    try:
+        for obj in objs:
+            # 嵌套 hold 同一个对象时由最外层负责补发
+            if id(obj) in _held:
+                continue
+            before = _snapshot(obj)
+            obj._trait_change_notify(False)
+            _held.add(id(obj))
+            # 先登记再 yield：后面的对象出错时，finally 会恢复已经关掉通知的对象
+            snapshots.append((obj, before))
+        yield
+    finally:
+        changes = []
+        for obj, before in snapshots:
+            obj._trait_change_notify(True)
+            _held.discard(id(obj))
+            for name, old in before.items():
+                new = getattr(obj, name)
+                if _changed(old, new):
+                    changes.append((obj, name, old, new))
+        if loop is None:
+            _deliver(changes)
+        elif changes:
+            loop.call_soon_threadsafe(_deliver, changes)
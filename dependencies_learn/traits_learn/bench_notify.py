@@ -0,0 +1,51 @@
+# 对比逐次赋值触发通知 和 hold_notifications 合并通知
+# python -m dependencies_learn.traits_learn.bench_notify --objects 5000 --updates 10
+import argparse
+import time
+
+from traits.api import on_trait_change
+
+from dependencies_learn.traits_learn.batch_notify import hold_notifications
+from dependencies_learn.traits_learn.demo import Employee
+
+
+class CountingEmployee(Employee):
+    calls = 0
+    log = []
+
+    @on_trait_change('name,age')
+    def update(self, object, name, old, new):
+        # 模拟一个有开销的观察者（写日志、刷新界面等）
+        CountingEmployee.calls += 1
+        CountingEmployee.log.append(f"{name} changed from {old} to {new}")
+
+
+def bulk_update(employees, updates):
+    for i in range(updates):
+        for emp in employees:
+            emp.name = f"name_{i}"
+            emp.age = i
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--objects', type=int, default=5000)
+    parser.add_argument('--updates', type=int, default=10)
+    args = parser.parse_args()
+
+    for label, held in [('per-assignment', False), ('hold_notifications', True)]:
+        employees = [CountingEmployee(name='John', age=30) for _ in range(args.objects)]
+        CountingEmployee.calls = 0
+        CountingEmployee.log.clear()
+        start = time.perf_counter()
+        if held:
+            with hold_notifications(employees):
+                bulk_update(employees, args.updates)
+        else:
+            bulk_update(employees, args.updates)
+        total = time.perf_counter() - start
+        print(f"{label:<20} {total:.3f}s, {CountingEmployee.calls} notifications")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# 本地替身：不需要 neo4j 和 OpenAI，用 sleep 模拟延迟
+import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import List
+
+
+class FakeGraph:
+    """Graphiti stand-in: every episode becomes one fact of its group."""
+
+    def __init__(self, search_latency: float = 0.05, add_latency: float = 0.3):
+        self.search_latency = search_latency
+        self.add_latency = add_latency
+        self.episodes = defaultdict(list)
+        self.search_calls = 0
+        self.add_calls = 0
+
+    async def build_indices_and_constraints(self):
+        pass
+
+    async def search(self, query, num_results=5, group_ids=None, search_scope="edges") -> List[SimpleNamespace]:
+        self.search_calls += 1
+        await asyncio.sleep(self.search_latency)
+        facts = [body for group in group_ids or [] for body in self.episodes[group]]
+        return [SimpleNamespace(fact=fact) for fact in facts[-num_results:]]
+
+    async def add_episode(self, name, episode_body, source, source_description, reference_time, group_id):
+        self.add_calls += 1
+        await asyncio.sleep(self.add_latency)
+        self.episodes[group_id].append(episode_body.replace("\n", " | "))
+
+    async def close(self):
+        pass
+
+
+class FakeLLM:
+    """AsyncOpenAI stand-in exposing llm.chat.completions.create."""
+
+    def __init__(self, latency: float = 0.2):
+        self.latency = latency
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages, temperature=0.0):
+        await asyncio.sleep(self.latency)
+        facts = messages[0]["content"].count("\n- ")
+        content = f"({facts} facts) you said: {messages[-1]['content']}"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
@@ -0,0 +1,298 @@
+# ChatMemoryAgent 的流水线版本
+# 原来每一轮: g.search -> 阻塞的 openai.ChatCompletion.create -> await g.add_episode -> 返回
+# 现在:
+# - LLM 用异步客户端 (AsyncOpenAI)，不阻塞事件循环
+# - add_episode 放进后台队列，限制并发写入，用户不用等写入完成；
+#   一个窗口内的 episode 写完后每个 group 只让缓存失效一次（graphiti 那边仍是逐条 add_episode）
+# - 检索结果按 group_id 缓存，新的 episode 写入后失效
+# graph / llm 都可以注入，fakes.py 里有带延迟的本地替身
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class TurnTiming:
+    retrieval: float
+    generation: float
+    ingestion: float
+    total: float
+    cache_hit: bool
+
+
+class RetrievalCache:
+    """LRU cache of search results keyed by (group_id, query), with a TTL."""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, list]]" = OrderedDict()
+        # bumped on every invalidate, a search started before that must not be cached
+        self._generations: Dict[str, int] = {}
+
+    def generation(self, group_id: str) -> int:
+        return self._generations.get(group_id, 0)
+
+    def get(self, group_id: str, query: str) -> Optional[list]:
+        key = (group_id, query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def put(self, group_id: str, query: str, results: list, generation: Optional[int] = None) -> None:
+        """
+        Store results; pass the generation read before the search so results
+        fetched across an invalidation are dropped instead of cached.
+        """
+        if generation is not None and generation != self.generation(group_id):
+            return
+        self._entries[(group_id, query)] = (time.monotonic(), results)
+        self._entries.move_to_end((group_id, query))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, group_id: str) -> None:
+        self._generations[group_id] = self.generation(group_id) + 1
+        for key in [key for key in self._entries if key[0] == group_id]:
+            del self._entries[key]
+
+
+class IngestionError(Exception):
+    """Raised by flush()/close() when episodes could not be written."""
+
+    def __init__(self, failed: List[Tuple[Dict[str, Any], BaseException]]):
+        super().__init__(f"{len(failed)} episode(s) failed to ingest: {failed[0][1]!r}")
+        # (episode kwargs, exception) pairs, episodes can be submitted again
+        self.failed = failed
+
+
+class EpisodeIngestor:
+    """
+    Background queue for graph.add_episode calls.
+
+    Episodes are drained in windows of up to window_size (waiting at most
+    window_wait for more to arrive). Each episode is still its own
+    add_episode call, at most max_concurrency of them at once; the window
+    only means on_ingested is called once per group_id after all of its
+    episodes landed, instead of once per episode. Failed episodes are
+    logged and reported by the next flush()/close() as IngestionError.
+    """
+
+    def __init__(
+        self,
+        graph: Any,
+        window_size: int = 8,
+        max_concurrency: int = 4,
+        window_wait: float = 0.01,
+        on_ingested: Optional[Callable[[str], None]] = None,
+    ):
+        self.graph = graph
+        self.window_size = window_size
+        self.window_wait = window_wait
+        self.on_ingested = on_ingested
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self.worker: Optional[asyncio.Task] = None
+        self.failed: List[Tuple[Dict[str, Any], BaseException]] = []
+
+    def start(self) -> None:
+        # also restarts a worker that died, otherwise flush() would wait forever
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self._run(), name="episode-ingestor")
+
+    def submit(self, **episode: Any) -> None:
+        self.start()
+        self.queue.put_nowait(episode)
+
+    async def _next_window(self) -> List[Dict[str, Any]]:
+        window = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.window_wait
+        while len(window) < self.window_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                window.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return window
+
+    async def _add(self, episode: Dict[str, Any]) -> None:
+        async with self.semaphore:
+            await self.graph.add_episode(**episode)
+
+    async def _run(self) -> None:
+        while True:
+            window = await self._next_window()
+            try:
+                results = await asyncio.gather(*(self._add(ep) for ep in window), return_exceptions=True)
+                for episode, result in zip(window, results):
+                    if isinstance(result, BaseException):
+                        logging.error("failed to ingest episode %s: %r", episode.get("name"), result)
+                        self.failed.append((episode, result))
+                if self.on_ingested is not None:
+                    for group_id in {ep.get("group_id") for ep in window}:
+                        try:
+                            self.on_ingested(group_id)
+                        except Exception:
+                            # a broken callback must not kill the worker and leave the queue undrained
+                            logging.exception("on_ingested(%r) failed", group_id)
+            finally:
+                for _ in window:
+                    self.queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every submitted episode has been processed, raise IngestionError on failures."""
+        if not self.queue.empty():
+            self.start()
+        await self.queue.join()
+        if self.failed:
+            failed, self.failed = self.failed, []
+            raise IngestionError(failed)
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        finally:
+            if self.worker is not None:
+                self.worker.cancel()
+                try:
+                    await self.worker
+                except asyncio.CancelledError:
+                    pass
+                self.worker = None
+
+
+def _message_source() -> Any:
+    try:
+        from graphiti_core.nodes import EpisodeType
+    except ImportError:
+        return "message"
+    return EpisodeType.message
+
+
+class ChatMemoryAgent:
+    def __init__(
+        self,
+        graph: Any,
+        llm: Any,
+        group_id: str = "default",
+        model: str = "gpt-4o-mini",
+        background_ingest: bool = True,
+        cache: Optional[RetrievalCache] = None,
+        window_size: int = 8,
+        max_concurrency: int = 4,
+    ):
+        """
+        :param graph: Graphiti-like client with search / add_episode / close.
+        :param llm: AsyncOpenAI-like client (llm.chat.completions.create is awaitable).
+        :param group_id: Memory group of this conversation.
+        :param background_ingest: Queue add_episode instead of awaiting it in the turn.
+        :param cache: Retrieval cache, pass None to always search.
+        """
+        self.group_id = group_id
+        self.g = graph
+        self.llm = llm
+        self.model = model
+        self.cache = cache
+        self.source = _message_source()
+        self.ingestor = EpisodeIngestor(
+            graph,
+            window_size=window_size,
+            max_concurrency=max_concurrency,
+            on_ingested=cache.invalidate if cache is not None else None,
+        ) if background_ingest else None
+        self.timings: List[TurnTiming] = []
+
+    @classmethod
+    def connect(cls, neo4j_uri=None, user="neo4j", password=None, group_id="default", **kwargs) -> "ChatMemoryAgent":
+        """Build the agent on a real Graphiti graph and AsyncOpenAI client."""
+        from graphiti_core import Graphiti
+        from openai import AsyncOpenAI
+
+        return cls(Graphiti(neo4j_uri, user, password), AsyncOpenAI(), group_id=group_id, **kwargs)
+
+    async def init(self):
+        await self.g.build_indices_and_constraints()
+
+    async def _search(self, query: str) -> Tuple[list, bool]:
+        generation = None
+        if self.cache is not None:
+            results = self.cache.get(self.group_id, query)
+            if results is not None:
+                return results, True
+            generation = self.cache.generation(self.group_id)
+        results = await self.g.search(
+            query=query,
+            num_results=5,
+            group_ids=[self.group_id],
+            search_scope="edges"
+        )
+        if self.cache is not None:
+            self.cache.put(self.group_id, query, results, generation)
+        return results, False
+
+    async def process_message(self, query: str) -> str:
+        start = time.perf_counter()
+
+        # 1. 检索相关 facts（可能命中缓存）
+        results, cache_hit = await self._search(query)
+        retrieved = time.perf_counter()
+
+        # 2. 构建 context，异步调用 LLM
+        facts_text = "\n".join(f"- {r.fact}" for r in results if r.fact)
+        system_prompt = f"You are an assistant that remembers user history.\n\nRelevant facts:\n{facts_text or '＊无已知历史＊'}"
+        resp = await self.llm.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": query}
+            ],
+            temperature=0.0
+        )
+        answer = resp.choices[0].message.content.strip()
+        generated = time.perf_counter()
+
+        # 3. 把此次对话 turn 写入 memory，后台模式下只是入队
+        now = datetime.now(timezone.utc)
+        episode = dict(
+            name=f"turn_{now.timestamp()}",
+            episode_body=f"User: {query}\nAssistant: {answer}",
+            source=self.source,
+            source_description="chat turn",
+            reference_time=now,
+            group_id=self.group_id
+        )
+        if self.ingestor is not None:
+            self.ingestor.submit(**episode)
+        else:
+            await self.g.add_episode(**episode)
+            if self.cache is not None:
+                self.cache.invalidate(self.group_id)
+        done = time.perf_counter()
+
+        self.timings.append(TurnTiming(
+            retrieval=retrieved - start,
+            generation=generated - retrieved,
+            ingestion=done - generated,
+            total=done - start,
+            cache_hit=cache_hit,
+        ))
+        return answer
+
+    async def close(self):
+        try:
+            if self.ingestor is not None:
+                await self.ingestor.close()
+        finally:
+            await self.g.close()
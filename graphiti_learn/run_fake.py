@@ -0,0 +1,55 @@
+# 用本地替身端到端跑一遍，打印每一轮的延迟分解
+# python -m graphiti_learn.run_fake
+import argparse
+import asyncio
+import time
+
+from graphiti_learn.fakes import FakeGraph, FakeLLM
+from graphiti_learn.memory_agent import ChatMemoryAgent, RetrievalCache
+
+questions = [
+    "我叫 Alice，我最喜欢机器学习。",
+    "请问我的名字是什么？",
+    "我喜欢什么领域？",
+    "请问我的名字是什么？",
+]
+
+
+async def run(label, background_ingest, cache, turns, args):
+    graph = FakeGraph(search_latency=args.search_latency, add_latency=args.add_latency)
+    agent = ChatMemoryAgent(
+        graph,
+        FakeLLM(latency=args.llm_latency),
+        group_id="user_1234",
+        background_ingest=background_ingest,
+        cache=cache,
+    )
+    await agent.init()
+    start = time.perf_counter()
+    for i in range(turns):
+        await agent.process_message(questions[i % len(questions)])
+    elapsed = time.perf_counter() - start
+    await agent.close()
+
+    print(f"== {label}: {turns} turns in {elapsed:.3f}s, "
+          f"{graph.search_calls} searches, {graph.add_calls} episodes written")
+    print(f"{'turn':>4} {'retrieval':>10} {'generation':>11} {'ingestion':>10} {'total':>8}  cache")
+    for i, t in enumerate(agent.timings):
+        print(f"{i:>4} {t.retrieval:>10.3f} {t.generation:>11.3f} {t.ingestion:>10.3f} {t.total:>8.3f}  "
+              f"{'hit' if t.cache_hit else 'miss'}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--turns', type=int, default=8)
+    parser.add_argument('--search-latency', type=float, default=0.05)
+    parser.add_argument('--llm-latency', type=float, default=0.2)
+    parser.add_argument('--add-latency', type=float, default=0.3)
+    args = parser.parse_args()
+
+    await run("sequential (original)", False, None, args.turns, args)
+    await run("background ingest + cache", True, RetrievalCache(), args.turns, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
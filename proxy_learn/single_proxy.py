@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 
 class ConfigurableHTTPProxy:
@@ -6,6 +5,9 @@ class ConfigurableHTTPProxy:
         self.api_url = api_url
 
     async def api_request(self, method, path, body=None):
+        # aiohttp 很重，第一次请求时再 import
+        import aiohttp
+
         url = self.api_url + path
         async with aiohttp.ClientSession() as session:
             async with session.request(method, url, json=body) as resp:
@@ -24,6 +26,8 @@ class ConfigurableHTTPProxy:
         return await self.api_request('DELETE', f'/api/routes{routespec}')
 
 async def main():
+    import aiohttp
+
     proxy = ConfigurableHTTPProxy(api_url='http://localhost:8002')
     # 添加路由
     response = await proxy.add_route('/user/test/', 'http://127.0.0.1:8888/')
@@ -40,4 +44,5 @@ async def main():
     print("Delete route response:", response)
 
 # 运行主函数
-asyncio.run(main())
+if __name__ == '__main__':
+    asyncio.run(main())